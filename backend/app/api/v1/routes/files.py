@@ -48,23 +48,31 @@ async def download_file(
     """
     file_service = FileService(db)
     
-    file_path = await file_service.get_file_download_path(file_id, guest_token)
-    
-    if not file_path:
+    download = await file_service.get_file_download_path(file_id, guest_token)
+
+    if not download:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found or expired"
         )
-    
+
+    file_record, file_path, stat_result = download
+
     # Track download
     await file_service.track_download(file_id)
-    
+
     logger.info("File download", file_id=file_id)
-    
+
+    # Passing stat_result lets starlette skip its own stat call and emit
+    # ETag/Last-Modified for conditional requests; the body itself is
+    # streamed via the server's sendfile path when available. Serving the
+    # stored MIME type and original filename lets browsers stream/render
+    # PDFs progressively instead of treating them as opaque blobs.
     return FileResponse(
         path=file_path,
-        media_type="application/octet-stream",
-        filename=file_path.name
+        media_type=file_record.mime_type or "application/octet-stream",
+        filename=file_record.original_filename or file_path.name,
+        stat_result=stat_result
     )
 
 
@@ -14,6 +14,41 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
+# Registered before /{job_id} so "history" isn't swallowed as a job id
+@router.get("/history", response_model=JobHistory)
+async def get_job_history(
+    page: int = 1,
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    guest_token: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get job history (requires authentication or guest token)
+
+    Pass the `next_cursor` from a previous page for constant-time
+    pagination regardless of depth; `page` remains for numbered UIs.
+    """
+    # Without an owner credential the service-level filters are empty
+    # and the query would page every user's jobs; refuse instead
+    if not guest_token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication or guest token required"
+        )
+
+    job_service = JobService(db)
+
+    history = await job_service.get_job_history(
+        guest_token=guest_token,
+        page=page,
+        page_size=page_size,
+        cursor=cursor
+    )
+
+    return history
+
+
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job_status(
     job_id: str,
@@ -85,24 +120,3 @@ async def cancel_job(
         "success": True,
         "message": "Job cancelled successfully"
     }
-
-
-@router.get("/history", response_model=JobHistory)
-async def get_job_history(
-    page: int = 1,
-    page_size: int = 20,
-    guest_token: Optional[str] = None,
-    db: AsyncSession = Depends(get_db)
-):
-    """
-    Get job history (requires authentication or guest token)
-    """
-    job_service = JobService(db)
-    
-    history = await job_service.get_job_history(
-        guest_token,
-        page,
-        page_size
-    )
-    
-    return history
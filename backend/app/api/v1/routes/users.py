@@ -14,6 +14,15 @@ from fastapi.security import HTTPAuthorizationCredentials
 router = APIRouter()
 
 
+async def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
+    """Dependency providing a UserService bound to the request session.
+
+    FastAPI caches get_db per request, so every dependency in the chain
+    shares one session/connection instead of resolving its own.
+    """
+    return UserService(db)
+
+
 async def get_current_active_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
@@ -21,25 +30,24 @@ async def get_current_active_user(
     """Dependency to get current active user"""
     auth_service = AuthService(db)
     user = await auth_service.get_current_user(credentials.credentials)
-    
+
     if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials"
         )
-    
+
     return user
 
 
 @router.get("/dashboard", response_model=UserDashboard)
 async def get_dashboard(
     current_user: UserResponse = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    user_service: UserService = Depends(get_user_service)
 ):
     """
     Get user dashboard with statistics
     """
-    user_service = UserService(db)
     dashboard = await user_service.get_user_dashboard(current_user.id)
     return dashboard
 
@@ -58,12 +66,11 @@ async def get_profile(
 async def update_profile(
     user_update: UserUpdate,
     current_user: UserResponse = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    user_service: UserService = Depends(get_user_service)
 ):
     """
     Update current user profile
     """
-    user_service = UserService(db)
     updated_user = await user_service.update_user(current_user.id, user_update)
     return updated_user
 
@@ -71,12 +78,11 @@ async def update_profile(
 @router.delete("/account")
 async def delete_account(
     current_user: UserResponse = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    user_service: UserService = Depends(get_user_service)
 ):
     """
     Delete current user account
     """
-    user_service = UserService(db)
     await user_service.delete_user(current_user.id)
     
     return {
@@ -0,0 +1,63 @@
+"""
+Small Redis-backed cache for hot read paths
+
+Every helper fails open: a Redis outage degrades to plain DB reads
+instead of breaking requests, so callers never need try/except.
+"""
+from typing import Any, Optional
+
+import orjson
+import redis.asyncio as aioredis
+
+from .config import settings
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Single shared client per process; redis-py manages the connection pool
+_client: Optional[aioredis.Redis] = None
+
+
+def get_cache_client() -> aioredis.Redis:
+    """Get or create the shared async Redis client"""
+    global _client
+    if _client is None:
+        _client = aioredis.from_url(
+            settings.REDIS_URL,
+            password=settings.REDIS_PASSWORD,
+        )
+    return _client
+
+
+async def cache_get(key: str) -> Optional[Any]:
+    """Fetch a cached value; None on miss, bad payload or Redis outage"""
+    try:
+        raw = await get_cache_client().get(key)
+    except Exception as e:
+        logger.warning("Cache read failed", key=key, error=str(e))
+        return None
+
+    if raw is None:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+
+
+async def cache_set(key: str, value: Any, ttl_seconds: int):
+    """Store a value with a TTL; failures are logged, never raised"""
+    try:
+        await get_cache_client().set(
+            key, orjson.dumps(value, default=str), ex=ttl_seconds
+        )
+    except Exception as e:
+        logger.warning("Cache write failed", key=key, error=str(e))
+
+
+async def cache_delete(*keys: str):
+    """Drop cached values; failures are logged, never raised"""
+    try:
+        await get_cache_client().delete(*keys)
+    except Exception as e:
+        logger.warning("Cache delete failed", keys=keys, error=str(e))
@@ -2,6 +2,7 @@
 Core configuration module using Pydantic Settings V2
 Handles all environment variables and application configuration
 """
+from functools import lru_cache
 from typing import List, Optional, Any, Union
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -35,6 +36,7 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    BCRYPT_ROUNDS: int = 10
     
     # CORS
     CORS_ORIGINS: Union[List[str], str] = ["http://localhost:3000"]
@@ -56,7 +58,15 @@ class Settings(BaseSettings):
         return values
     
     # Database
+    # Pool limits are per process: gunicorn runs 2*cpu+1 workers by
+    # default, so total demand is workers * (size + overflow) plus the
+    # Celery workers' sync pools - size against Postgres
+    # max_connections (raised to 300 in the compose files) before
+    # raising these
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 5
+    DB_POOL_OVERFLOW: int = 5
+    DB_POOL_RECYCLE_SECONDS: int = 1800
     POSTGRES_USER: str = "fileforge"
     POSTGRES_PASSWORD: str = "fileforge_dev_pass"
     POSTGRES_DB: str = "fileforge"
@@ -70,12 +80,18 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
     MAX_UPLOAD_SIZE: int = 104857600  # 100MB
+    MAX_FILES_PER_REQUEST: int = 50
     
     # File Storage
     STORAGE_TYPE: str = "local"  # local or s3
     UPLOAD_DIR: Path = Path("./uploads")
     TEMP_DIR: Path = Path("./temp")
     FILE_TTL_HOURS: int = 24
+
+    # File Processing
+    # 150 dpi suits screen viewing; raster buffers and archive size
+    # scale with dpi squared, so 200 -> 150 nearly halves both
+    PDF_RENDER_DPI: int = 150
     
     # AWS S3
     AWS_ACCESS_KEY_ID: Optional[str] = None
@@ -127,8 +143,19 @@ class Settings(BaseSettings):
         self.TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache
+def get_settings() -> Settings:
+    """Return the cached Settings instance.
+
+    Environment parsing and validation run exactly once per process;
+    callers that can't import the module-level instance (e.g. FastAPI
+    dependency overrides in tests) get the same cached object.
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
 # Create required directories on startup
 settings.create_upload_dirs()
@@ -1,26 +1,107 @@
 """
 Structured logging configuration using structlog
 """
+import atexit
 import logging
+import queue
+from functools import lru_cache
 import sys
+import threading
 from typing import Any
+import orjson
 import structlog
 from .config import settings
 
 
+class _AsyncByteWriter:
+    """File-like writer that hands log bytes to a background thread.
+
+    write() only enqueues, so request handlers (and the asyncio event
+    loop) never block on a stdout write; a daemon thread drains the
+    queue and performs the actual syscalls.
+    """
+
+    _SENTINEL = object()
+
+    def __init__(self, target):
+        self._target = target
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread = None
+        atexit.register(self.close)
+
+    def _ensure_thread(self) -> None:
+        # Threads don't survive fork: a prefork worker child inherits
+        # this writer with a dead drain thread, and anything it
+        # enqueued would pile up unwritten forever. (Re)start lazily so
+        # each process that logs gets its own live drain thread
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._drain, name="log-writer", daemon=True
+                )
+                self._thread.start()
+
+    def write(self, data: bytes) -> None:
+        self._queue.put(data)
+        self._ensure_thread()
+
+    def flush(self) -> None:
+        # Flushing is handled by the drain thread
+        pass
+
+    def _drain(self) -> None:
+        # Write everything that is queued before flushing once, so a
+        # burst of N records costs one flush instead of N write+flush
+        # syscall pairs
+        while True:
+            item = self._queue.get()
+            if item is self._SENTINEL:
+                self._target.flush()
+                return
+            self._target.write(item)
+            try:
+                while True:
+                    item = self._queue.get_nowait()
+                    if item is self._SENTINEL:
+                        self._target.flush()
+                        return
+                    self._target.write(item)
+            except queue.Empty:
+                pass
+            self._target.flush()
+
+    def close(self) -> None:
+        self._queue.put(self._SENTINEL)
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=2)
+
+
 def configure_logging():
     """Configure structured logging for the application"""
-    
+
     # Determine processors based on environment
     if settings.LOG_FORMAT == "json":
+        # orjson serializes straight to bytes, so BytesLoggerFactory can
+        # write to sys.stdout.buffer without the str->bytes re-encode the
+        # stdlib JSONRenderer + PrintLogger combination pays per record
         processors = [
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(
+                serializer=lambda obj, **kw: orjson.dumps(obj, default=str)
+            )
         ]
+        logger_factory = structlog.BytesLoggerFactory(
+            file=_AsyncByteWriter(sys.stdout.buffer)
+        )
     else:
         processors = [
             structlog.contextvars.merge_contextvars,
@@ -30,14 +111,15 @@ def configure_logging():
             structlog.processors.format_exc_info,
             structlog.dev.ConsoleRenderer()
         ]
-    
+        logger_factory = structlog.PrintLoggerFactory()
+
     structlog.configure(
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(
             logging.getLevelName(settings.LOG_LEVEL)
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
     
@@ -49,16 +131,20 @@ def configure_logging():
     )
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str = None) -> Any:
     """
     Get a structured logger instance
-    
+
     Args:
         name: Optional logger name (typically __name__)
-        
+
     Returns:
         Configured structlog logger
     """
+    # Memoized so repeat callers get the already-bound logger instead of
+    # a fresh lazy proxy; the filtering bound logger then drops
+    # below-level calls before any event-dict formatting happens
     return structlog.get_logger(name)
 
 
@@ -4,11 +4,28 @@ Security utilities: JWT, password hashing, token generation
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from passlib.context import CryptContext
-from jose import jwt, JWTError
+import jwt
 from .config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context - bcrypt cost is tunable because passlib's
+# default of 12 rounds makes hashing the dominant cost of /login;
+# existing hashes verify at their embedded cost and are re-hashed on
+# next login via deprecated="auto"
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+
+# Default token lifetimes, built once instead of per call
+_ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TOKEN_EXPIRES = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+# Snapshot the signing parameters once; encode/decode run on every
+# authenticated request and don't need pydantic attribute lookups
+_JWT_KEY = settings.JWT_SECRET_KEY
+_JWT_ALG = settings.JWT_ALGORITHM
+_JWT_ALGS = [settings.JWT_ALGORITHM]
 
 
 class SecurityUtils:
@@ -27,75 +44,63 @@ class SecurityUtils:
     @staticmethod
     def create_access_token(
         data: Dict[str, Any],
-        expires_delta: Optional[timedelta] = None
+        expires_delta: Optional[timedelta] = None,
+        now: Optional[datetime] = None
     ) -> str:
         """
         Create JWT access token
-        
+
         Args:
             data: Payload data to encode in token
             expires_delta: Optional custom expiration time
-            
+            now: Optional issue timestamp (shared by create_token_pair)
+
         Returns:
             Encoded JWT token
         """
         to_encode = data.copy()
-        
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(
-                minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-            )
-        
+
+        now = now or datetime.utcnow()
+        expire = now + (expires_delta or _ACCESS_TOKEN_EXPIRES)
+
         to_encode.update({
             "exp": expire,
-            "iat": datetime.utcnow(),
+            "iat": now,
             "type": "access"
         })
         
-        encoded_jwt = jwt.encode(
-            to_encode,
-            settings.JWT_SECRET_KEY,
-            algorithm=settings.JWT_ALGORITHM
-        )
+        encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=_JWT_ALG)
         return encoded_jwt
     
     @staticmethod
     def create_refresh_token(
         data: Dict[str, Any],
-        expires_delta: Optional[timedelta] = None
+        expires_delta: Optional[timedelta] = None,
+        now: Optional[datetime] = None
     ) -> str:
         """
         Create JWT refresh token
-        
+
         Args:
             data: Payload data to encode in token
             expires_delta: Optional custom expiration time
-            
+            now: Optional issue timestamp (shared by create_token_pair)
+
         Returns:
             Encoded JWT refresh token
         """
         to_encode = data.copy()
-        
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(
-                days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-            )
-        
+
+        now = now or datetime.utcnow()
+        expire = now + (expires_delta or _REFRESH_TOKEN_EXPIRES)
+
         to_encode.update({
             "exp": expire,
-            "iat": datetime.utcnow(),
+            "iat": now,
             "type": "refresh"
         })
         
-        encoded_jwt = jwt.encode(
-            to_encode,
-            settings.JWT_SECRET_KEY,
-            algorithm=settings.JWT_ALGORITHM
-        )
+        encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=_JWT_ALG)
         return encoded_jwt
     
     @staticmethod
@@ -110,13 +115,9 @@ class SecurityUtils:
             Decoded payload or None if invalid
         """
         try:
-            payload = jwt.decode(
-                token,
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM]
-            )
+            payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGS)
             return payload
-        except JWTError:
+        except jwt.InvalidTokenError:
             return None
     
     @staticmethod
@@ -130,11 +131,12 @@ class SecurityUtils:
         Returns:
             Dictionary with access_token and refresh_token
         """
+        now = datetime.utcnow()
         access_token = SecurityUtils.create_access_token(
-            data={"sub": str(user_id)}
+            data={"sub": str(user_id)}, now=now
         )
         refresh_token = SecurityUtils.create_refresh_token(
-            data={"sub": str(user_id)}
+            data={"sub": str(user_id)}, now=now
         )
         
         return {
@@ -1,25 +1,37 @@
 """
 Database session management and base configuration
 """
+import threading
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
     async_sessionmaker
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import declarative_base
 from ..core.config import settings
 from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Create async engine
+# Create async engine - LIFO checkout keeps hot connections hot and
+# lets idle overflow connections age out and close under bursty load
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_POOL_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_use_lifo=True,
+    # Explicit so a URL/driver misconfiguration can't silently fall back
+    # to the thread-blocking QueuePool
+    poolclass=AsyncAdaptedQueuePool,
+    # Room for every hot query (job/file/user lookups) to stay prepared
+    # per connection, skipping parse+plan on repeat execution. Must be
+    # set to 0 if a transaction-mode pgbouncer is ever put in front
+    connect_args={"prepared_statement_cache_size": 1024},
 )
 
 # Create async session factory
@@ -31,40 +43,67 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
-# Create synchronous engine for Celery tasks (lazy loading)
+# Create synchronous engine for Celery tasks (lazy loading).
+# Double-checked locking: concurrent first calls from worker threads
+# must not each build an engine, or we leak whole connection pools
 _sync_engine = None
+_sync_lock = threading.Lock()
 
 def get_sync_engine():
     """Get or create synchronous engine for Celery tasks"""
     global _sync_engine
     if _sync_engine is None:
-        from sqlalchemy import create_engine as create_sync_engine
-        # Use the async URL but create a synchronous connection
-        sync_url = settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
-        _sync_engine = create_sync_engine(
-            sync_url,
-            echo=settings.DEBUG,
-            pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10,
-        )
+        with _sync_lock:
+            if _sync_engine is None:
+                from sqlalchemy import create_engine as create_sync_engine
+                # Use the async URL but create a synchronous connection
+                sync_url = settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
+                _sync_engine = create_sync_engine(
+                    sync_url,
+                    echo=settings.DEBUG,
+                    pool_pre_ping=True,
+                    pool_size=5,
+                    max_overflow=10,
+                    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+                    pool_use_lifo=True,
+                )
     return _sync_engine
 
 # Create synchronous session factory (lazy loading)
+SessionLocal = None
+
 def get_session_local():
     """Get SessionLocal class"""
     global SessionLocal
     if SessionLocal is None:
-        from sqlalchemy.orm import sessionmaker as create_sessionmaker
-        SessionLocal = create_sessionmaker(
-            bind=get_sync_engine(),
-            expire_on_commit=False,
-            autocommit=False,
-            autoflush=False,
-        )
+        # Resolve the engine before taking the lock; it shares _sync_lock
+        sync_engine = get_sync_engine()
+        with _sync_lock:
+            if SessionLocal is None:
+                from sqlalchemy.orm import sessionmaker as create_sessionmaker
+                SessionLocal = create_sessionmaker(
+                    bind=sync_engine,
+                    expire_on_commit=False,
+                    autocommit=False,
+                    autoflush=False,
+                )
     return SessionLocal
 
-SessionLocal = None
+# Process-wide scoped session registry for Celery task helpers: each
+# worker thread keeps one Session across the many short helper calls a
+# task makes, instead of building a new one per status update
+ScopedSession = None
+
+def get_scoped_session():
+    """Get the scoped_session registry for synchronous worker code"""
+    global ScopedSession
+    if ScopedSession is None:
+        session_local = get_session_local()
+        with _sync_lock:
+            if ScopedSession is None:
+                from sqlalchemy.orm import scoped_session
+                ScopedSession = scoped_session(session_local)
+    return ScopedSession
 
 # Base class for models
 Base = declarative_base()
@@ -91,7 +130,18 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 async def init_db():
     """Initialize database (create tables)"""
-    async with engine.begin() as conn:
+    if settings.is_production:
+        # Schema is managed by Alembic migrations in production;
+        # create_all would issue one existence-check SELECT per table on
+        # every replica startup for nothing
+        logger.info("Skipping create_all in production, schema managed by Alembic")
+        return
+
+    # AUTOCOMMIT: create_all is mostly existence-check reflection
+    # queries, and DDL in Postgres commits per statement anyway; the
+    # wrapping BEGIN/COMMIT round-trips buy nothing
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
         await conn.run_sync(Base.metadata.create_all)
     logger.info("Database initialized successfully")
 
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
     String, Integer, Boolean, DateTime, Text, 
-    Enum as SQLEnum, ForeignKey, Index, BigInteger
+    Enum as SQLEnum, ForeignKey, Index, BigInteger, func
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum as PyEnum
@@ -42,7 +42,7 @@ class User(Base):
     """User model for authentication and authorization"""
     __tablename__ = "users"
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     username: Mapped[Optional[str]] = mapped_column(String(100), unique=True, nullable=True, index=True)
     hashed_password: Mapped[str] = mapped_column(String(255))
@@ -51,15 +51,18 @@ class User(Base):
     # User status
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False)
-    role: Mapped[UserRole] = mapped_column(SQLEnum(UserRole), default=UserRole.USER)
+    role: Mapped[UserRole] = mapped_column(
+        SQLEnum(UserRole, native_enum=False, length=20, validate_strings=False),
+        default=UserRole.USER
+    )
     
     # OAuth
     oauth_provider: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     oauth_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
     last_login: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Relationships
@@ -80,20 +83,24 @@ class Job(Base):
     """Job model for tracking file processing tasks"""
     __tablename__ = "jobs"
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    job_id: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
+    job_id: Mapped[str] = mapped_column(String(36), unique=True, index=True)
     
     # Job details
     tool_name: Mapped[str] = mapped_column(String(100), index=True)  # e.g., "pdf_merge", "pdf_split"
-    status: Mapped[JobStatus] = mapped_column(SQLEnum(JobStatus), default=JobStatus.PENDING, index=True)
+    status: Mapped[JobStatus] = mapped_column(
+        SQLEnum(JobStatus, native_enum=False, length=20, validate_strings=False),
+        default=JobStatus.PENDING,
+        index=True
+    )
     
     # User association (nullable for guest users)
-    user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    user_id: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey("users.id"), nullable=True, index=True)
     guest_token: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
     
     # Processing details
     input_files_count: Mapped[int] = mapped_column(Integer, default=0)
-    output_file_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("files.id"), nullable=True)
+    output_file_id: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey("files.id"), nullable=True)
     
     # Progress tracking
     progress: Mapped[int] = mapped_column(Integer, default=0)  # 0-100
@@ -105,8 +112,8 @@ class Job(Base):
     processing_time_seconds: Mapped[Optional[float]] = mapped_column(nullable=True)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), index=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
     expires_at: Mapped[datetime] = mapped_column(DateTime, index=True)
     
     # Relationships
@@ -118,6 +125,8 @@ class Job(Base):
         Index("idx_job_status_created", "status", "created_at"),
         Index("idx_job_expires", "expires_at"),
         Index("idx_job_user_created", "user_id", "created_at"),
+        Index("idx_job_guest_created", "guest_token", "created_at"),
+        Index("idx_job_user_status", "user_id", "status"),
     )
     
     def __repr__(self):
@@ -128,8 +137,8 @@ class File(Base):
     """File model for tracking uploaded and generated files"""
     __tablename__ = "files"
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    file_id: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
+    file_id: Mapped[str] = mapped_column(String(36), unique=True, index=True)
     
     # File details
     original_filename: Mapped[str] = mapped_column(String(255))
@@ -138,12 +147,14 @@ class File(Base):
     
     # File metadata
     file_size: Mapped[int] = mapped_column(BigInteger)  # Size in bytes
-    file_type: Mapped[FileType] = mapped_column(SQLEnum(FileType))
+    file_type: Mapped[FileType] = mapped_column(
+        SQLEnum(FileType, native_enum=False, length=20, validate_strings=False)
+    )
     mime_type: Mapped[str] = mapped_column(String(100))
     checksum: Mapped[str] = mapped_column(String(64))  # SHA256 hash
     
     # User association (nullable for guest users)
-    user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    user_id: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey("users.id"), nullable=True, index=True)
     guest_token: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
     
     # File status
@@ -160,8 +171,8 @@ class File(Base):
     last_downloaded_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), index=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
     expires_at: Mapped[datetime] = mapped_column(DateTime, index=True)
     
     # Relationships
@@ -171,6 +182,7 @@ class File(Base):
     __table_args__ = (
         Index("idx_file_expires", "expires_at", "is_deleted"),
         Index("idx_file_user_created", "user_id", "created_at"),
+        Index("idx_file_guest_created", "guest_token", "created_at"),
         Index("idx_file_checksum", "checksum"),
     )
     
@@ -182,12 +194,12 @@ class ApiKey(Base):
     """API key model for API access"""
     __tablename__ = "api_keys"
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
     key: Mapped[str] = mapped_column(String(64), unique=True, index=True)
     name: Mapped[str] = mapped_column(String(100))
     
     # User association
-    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
+    user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id"), index=True)
     
     # Key status
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -200,7 +212,7 @@ class ApiKey(Base):
     rate_limit_per_minute: Mapped[int] = mapped_column(Integer, default=60)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     def __repr__(self):
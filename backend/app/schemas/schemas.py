@@ -3,7 +3,7 @@ Pydantic schemas for request/response validation
 """
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from enum import Enum
 
 
@@ -41,13 +41,19 @@ class UserBase(BaseModel):
 class UserCreate(UserBase):
     password: str = Field(..., min_length=8)
     
-    @validator("password")
+    @field_validator("password")
+    @classmethod
     def validate_password(cls, v):
-        if not any(char.isdigit() for char in v):
+        # Single pass over the password instead of one scan per rule
+        has_digit = has_upper = False
+        for char in v:
+            has_digit |= char.isdigit()
+            has_upper |= char.isupper()
+            if has_digit and has_upper:
+                return v
+        if not has_digit:
             raise ValueError("Password must contain at least one digit")
-        if not any(char.isupper() for char in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        return v
+        raise ValueError("Password must contain at least one uppercase letter")
 
 
 class UserUpdate(BaseModel):
@@ -70,8 +76,7 @@ class UserResponse(UserBase):
     created_at: datetime
     last_login: Optional[datetime]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Auth Schemas
@@ -110,8 +115,7 @@ class FileResponse(BaseModel):
     expires_at: datetime
     download_count: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Job Schemas
@@ -134,8 +138,7 @@ class JobResponse(BaseModel):
     expires_at: datetime
     processing_time_seconds: Optional[float]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class JobStatusResponse(BaseModel):
@@ -149,7 +152,11 @@ class JobStatusResponse(BaseModel):
 # Tool Schemas
 class PDFMergeRequest(BaseModel):
     """Request to merge multiple PDFs"""
-    files: List[str] = Field(..., min_items=2, max_items=50)
+    model_config = ConfigDict(extra="ignore")
+
+    # min_length/max_length are the v2 spellings; the deprecated
+    # min_items/max_items went through a per-item compatibility shim
+    files: List[str] = Field(..., min_length=2, max_length=50)
     output_filename: Optional[str] = "merged.pdf"
 
 
@@ -218,7 +225,8 @@ class UserDashboard(BaseModel):
 
 class JobHistory(BaseModel):
     jobs: List[JobResponse]
-    total: int
+    total: Optional[int] = None  # omitted in cursor mode (no COUNT)
     page: int
     page_size: int
     has_more: bool
+    next_cursor: Optional[str] = None
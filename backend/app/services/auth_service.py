@@ -1,12 +1,17 @@
 """
 Authentication service - handles user authentication and token management
 """
+import asyncio
+import base64
+import hashlib
+import os
+import time
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import select, or_, update, case, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-import secrets
 
+from app.db.session import AsyncSessionLocal
 from app.models.models import User
 from app.schemas.schemas import UserCreate
 from app.core.security import (
@@ -17,6 +22,103 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Decoded-token cache: HMAC verification dominates per-request CPU on
+# authenticated traffic, and a client's burst of requests reuses the
+# same bearer token. Keyed by token digest (never the raw token) so a
+# heap dump doesn't leak credentials. The short TTL bounds how long a
+# just-revoked token keeps working. Only touched from the event loop,
+# so no lock; when full it's cleared wholesale rather than tracking LRU
+# order per request.
+_TOKEN_CACHE_TTL = 5.0
+_TOKEN_CACHE_MAX = 10000
+_token_cache: dict = {}
+
+# last_login writes are informational and fire on every successful
+# auth; coalesce them per worker and flush in one batched UPDATE
+# instead of paying a commit per login
+# Guest tokens are minted per anonymous visitor; pulling 64 tokens'
+# worth of entropy in one os.urandom call amortizes the syscall that
+# secrets.token_urlsafe would otherwise make per request. Only touched
+# from the event loop, so no lock
+_TOKEN_BYTES = 32
+_TOKEN_BATCH = 64
+_token_ring: list = []
+
+
+def _next_guest_token() -> str:
+    """Pop a pre-generated urlsafe token, refilling the ring in bulk"""
+    if not _token_ring:
+        blob = os.urandom(_TOKEN_BYTES * _TOKEN_BATCH)
+        _token_ring.extend(
+            base64.urlsafe_b64encode(
+                blob[i:i + _TOKEN_BYTES]
+            ).rstrip(b"=").decode("ascii")
+            for i in range(0, len(blob), _TOKEN_BYTES)
+        )
+    return _token_ring.pop()
+
+
+_LOGIN_FLUSH_INTERVAL = 30.0
+_pending_logins: dict = {}
+_login_flush_task: Optional[asyncio.Task] = None
+
+
+async def _flush_last_logins():
+    """Flush the coalesced last_login batch with a single UPDATE"""
+    global _login_flush_task
+    await asyncio.sleep(_LOGIN_FLUSH_INTERVAL)
+    _login_flush_task = None
+
+    batch = dict(_pending_logins)
+    _pending_logins.clear()
+    if not batch:
+        return
+
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(User)
+                .where(User.id.in_(batch))
+                .values(last_login=case(batch, value=User.id))
+            )
+            await session.commit()
+    except Exception as e:
+        # Losing a last_login stamp is acceptable; losing the login isn't
+        logger.warning(
+            "last_login flush failed", count=len(batch), error=str(e)
+        )
+
+
+def _resolve_access_token(token: str) -> Optional[int]:
+    """Return the user id for a valid access token, caching the decode"""
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.monotonic()
+
+    hit = _token_cache.get(key)
+    if hit is not None and hit[1] > now:
+        return hit[0]
+
+    payload = decode_token(token)
+    if not payload or payload.get("type") != "access":
+        return None
+
+    user_id = payload.get("sub")
+    if not user_id:
+        return None
+    user_id = int(user_id)
+
+    # Never cache past the token's own expiry
+    ttl = _TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl > 0:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            _token_cache.clear()
+        _token_cache[key] = (user_id, now + ttl)
+
+    return user_id
+
 
 class AuthService:
     """Authentication service"""
@@ -37,39 +139,46 @@ class AuthService:
         Raises:
             ValueError: If email already exists
         """
-        # Check if email exists
-        result = await self.db.execute(
-            select(User).where(User.email == user_data.email)
-        )
-        existing_user = result.scalar_one_or_none()
-        
-        if existing_user:
-            raise ValueError("Email already registered")
-        
-        # Check if username exists (if provided)
+        # One uniqueness probe for both fields instead of two sequential
+        # SELECTs; fetch just the columns needed to tell which collided
+        conflict_filter = User.email == user_data.email
         if user_data.username:
-            result = await self.db.execute(
-                select(User).where(User.username == user_data.username)
+            conflict_filter = or_(
+                conflict_filter, User.username == user_data.username
             )
-            existing_username = result.scalar_one_or_none()
-            
-            if existing_username:
+
+        result = await self.db.execute(
+            select(User.email, User.username).where(conflict_filter).limit(2)
+        )
+        for email, username in result:
+            if email == user_data.email:
+                raise ValueError("Email already registered")
+            if user_data.username and username == user_data.username:
                 raise ValueError("Username already taken")
         
-        # Create user
-        user = User(
-            email=user_data.email,
-            username=user_data.username,
-            full_name=user_data.full_name,
-            hashed_password=get_password_hash(user_data.password),
-            is_active=True,
-            is_verified=False
+        # Hash in a worker thread - bcrypt takes ~100ms by design and
+        # would otherwise stall the event loop for every registration
+        hashed_password = await asyncio.to_thread(
+            get_password_hash, user_data.password
         )
-        
-        self.db.add(user)
+
+        # Create user - RETURNING hands back the row with its
+        # server-generated id and defaults, so no refresh SELECT
+        result = await self.db.execute(
+            insert(User)
+            .values(
+                email=user_data.email,
+                username=user_data.username,
+                full_name=user_data.full_name,
+                hashed_password=hashed_password,
+                is_active=True,
+                is_verified=False
+            )
+            .returning(User)
+        )
+        user = result.scalar_one()
         await self.db.commit()
-        await self.db.refresh(user)
-        
+
         return user
     
     async def authenticate_user(
@@ -91,10 +200,17 @@ class AuthService:
             select(User).where(User.email == email)
         )
         user = result.scalar_one_or_none()
-        
-        if not user or not verify_password(password, user.hashed_password):
+
+        if not user:
             return None
-        
+
+        # bcrypt verification is as expensive as hashing; run it in a
+        # worker thread so other requests keep progressing
+        if not await asyncio.to_thread(
+            verify_password, password, user.hashed_password
+        ):
+            return None
+
         return user
     
     async def create_tokens(self, user_id: int) -> dict:
@@ -143,32 +259,20 @@ class AuthService:
         Returns:
             User if token is valid, None otherwise
         """
-        payload = decode_token(token)
-        
-        if not payload or payload.get("type") != "access":
-            return None
-        
-        user_id = payload.get("sub")
-        if not user_id:
+        user_id = _resolve_access_token(token)
+        if user_id is None:
             return None
-        
-        result = await self.db.execute(
-            select(User).where(User.id == int(user_id))
-        )
-        user = result.scalar_one_or_none()
-        
+
+        user = await self.db.get(User, user_id)
+
         return user
     
     async def update_last_login(self, user_id: int):
-        """Update user's last login timestamp"""
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
-        
-        if user:
-            user.last_login = datetime.utcnow()
-            await self.db.commit()
+        """Record the user's last login; flushed in a coalesced batch"""
+        global _login_flush_task
+        _pending_logins[user_id] = datetime.utcnow()
+        if _login_flush_task is None or _login_flush_task.done():
+            _login_flush_task = asyncio.create_task(_flush_last_logins())
     
     def create_guest_token(self) -> str:
         """
@@ -177,4 +281,4 @@ class AuthService:
         Returns:
             Guest token string
         """
-        return f"guest_{secrets.token_urlsafe(32)}"
+        return f"guest_{_next_guest_token()}"
@@ -1,8 +1,9 @@
 """
 File service - handles file operations
 """
-from typing import Optional
-from sqlalchemy import select
+import os
+from typing import Optional, Tuple
+from sqlalchemy import select, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from pathlib import Path
 from datetime import datetime
@@ -23,13 +24,19 @@ class FileService:
         self,
         file_id: str,
         guest_token: Optional[str] = None,
-        user_id: Optional[int] = None
+        user_id: Optional[int] = None,
+        include_expired: bool = False
     ) -> Optional[File]:
         """Get file by ID"""
         query = select(File).where(
             File.file_id == file_id,
             File.is_deleted == False
         )
+
+        # Filter expiry in SQL so an expired row is never hydrated just
+        # to be discarded in Python
+        if not include_expired:
+            query = query.where(File.expires_at >= func.now())
         
         if guest_token:
             query = query.where(File.guest_token == guest_token)
@@ -44,34 +51,37 @@ class FileService:
         file_id: str,
         guest_token: Optional[str] = None,
         user_id: Optional[int] = None
-    ) -> Optional[Path]:
-        """Get file path for download"""
+    ) -> Optional[Tuple[File, Path, os.stat_result]]:
+        """Get file record, path and stat result for download"""
         file = await self.get_file(file_id, guest_token, user_id)
-        
+
         if not file:
             return None
-        
-        # Check if expired
-        if file.expires_at < datetime.utcnow():
-            return None
-        
+
         file_path = Path(file.file_path)
-        if not file_path.exists():
+
+        # Stat once; the result is reused by the response so the route
+        # doesn't have to hit the filesystem a second time
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
             return None
-        
-        return file_path
+
+        return file, file_path, stat_result
     
     async def track_download(self, file_id: str):
         """Track file download"""
-        result = await self.db.execute(
-            select(File).where(File.file_id == file_id)
+        # Single atomic UPDATE: no hydration, one round trip, and the
+        # SQL-side increment can't lose counts to concurrent downloads
+        await self.db.execute(
+            update(File)
+            .where(File.file_id == file_id)
+            .values(
+                download_count=File.download_count + 1,
+                last_downloaded_at=func.now()
+            )
         )
-        file = result.scalar_one_or_none()
-        
-        if file:
-            file.download_count += 1
-            file.last_downloaded_at = datetime.utcnow()
-            await self.db.commit()
+        await self.db.commit()
     
     async def delete_file(
         self,
@@ -80,7 +90,11 @@ class FileService:
         user_id: Optional[int] = None
     ) -> bool:
         """Mark file as deleted"""
-        file = await self.get_file(file_id, guest_token, user_id)
+        # Owners can delete a file that has expired but not yet been
+        # swept; the expiry filter only guards reads
+        file = await self.get_file(
+            file_id, guest_token, user_id, include_expired=True
+        )
         
         if not file:
             return False
@@ -1,17 +1,48 @@
 """
 Job service - handles job status and management
 """
-from typing import Optional
-from sqlalchemy import select, desc
+import base64
+from typing import Optional, Tuple
+from sqlalchemy import select, desc, func, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, raiseload
 from datetime import datetime
 
 from app.models.models import Job, JobStatus, File
 from app.schemas.schemas import JobStatusResponse, JobHistory
+from app.core.cache import cache_get, cache_set, cache_delete
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Frontends poll /status every second or two per active job; a short
+# cache absorbs those hits without letting the UI lag noticeably
+_STATUS_CACHE_TTL = 2
+
+
+def _status_cache_key(
+    job_id: str, guest_token: Optional[str], user_id: Optional[int]
+) -> str:
+    # Owner is part of the key so a cached payload can never leak to a
+    # caller who wouldn't pass the DB-side ownership filter
+    return f"jobstatus:{job_id}:{guest_token or user_id or ''}"
+
+
+def _encode_cursor(job: Job) -> str:
+    """Encode a history-page boundary as an opaque cursor"""
+    raw = f"{job.created_at.isoformat()}|{job.job_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Optional[Tuple[datetime, str]]:
+    """Decode a cursor; returns None if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at_raw, _, job_id = raw.partition("|")
+        return datetime.fromisoformat(created_at_raw), job_id
+    except (ValueError, UnicodeDecodeError):
+        return None
+
 
 class JobService:
     """Service for job management"""
@@ -43,11 +74,26 @@ class JobService:
         user_id: Optional[int] = None
     ) -> Optional[JobStatusResponse]:
         """Get simplified job status"""
+        cache_key = _status_cache_key(job_id, guest_token, user_id)
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return JobStatusResponse(**cached)
+
         job = await self.get_job(job_id, guest_token, user_id)
-        
+
         if not job:
             return None
-        
+
+        # Workers publish live progress to Redis and only persist
+        # status transitions, so overlay the fresher tick when the job
+        # is mid-flight. max() guards against a stale Redis value
+        # surviving past a DB write
+        progress = job.progress
+        if job.status == JobStatus.PROCESSING:
+            live_progress = await cache_get(f"jobprogress:{job_id}")
+            if isinstance(live_progress, int):
+                progress = max(progress, live_progress)
+
         result_url = None
         if job.status == JobStatus.COMPLETED and job.output_file_id:
             # output_file_id stores the numeric PK; we need the public file_id uuid for download
@@ -58,13 +104,17 @@ class JobService:
             if file_uuid:
                 result_url = f"/api/v1/files/{file_uuid}/download"
         
-        return JobStatusResponse(
+        status_response = JobStatusResponse(
             job_id=job.job_id,
             status=job.status,
-            progress=job.progress,
+            progress=progress,
             result_url=result_url,
             error_message=job.error_message
         )
+        await cache_set(
+            cache_key, status_response.model_dump(), _STATUS_CACHE_TTL
+        )
+        return status_response
     
     async def cancel_job(
         self,
@@ -80,8 +130,10 @@ class JobService:
         
         job.status = JobStatus.CANCELLED
         job.updated_at = datetime.utcnow()
-        
+
         await self.db.commit()
+        # Make the cancellation visible to the next status poll
+        await cache_delete(_status_cache_key(job_id, guest_token, user_id))
         return True
     
     async def get_job_history(
@@ -89,33 +141,61 @@ class JobService:
         guest_token: Optional[str] = None,
         user_id: Optional[int] = None,
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        cursor: Optional[str] = None
     ) -> JobHistory:
-        """Get job history"""
-        query = select(Job).order_by(desc(Job.created_at))
-        
+        """Get job history
+
+        With a cursor, pagination is keyset-based: the query seeks
+        straight to the boundary row via the (owner, created_at) index
+        instead of scanning and discarding page*page_size rows, and the
+        COUNT is skipped entirely.
+        """
+        filters = []
         if guest_token:
-            query = query.where(Job.guest_token == guest_token)
+            filters.append(Job.guest_token == guest_token)
         elif user_id:
-            query = query.where(Job.user_id == user_id)
-        
-        # Get total count
-        count_result = await self.db.execute(query)
-        total = len(count_result.all())
-        
-        # Paginate
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
-        
+            filters.append(Job.user_id == user_id)
+
+        total = None
+        decoded = _decode_cursor(cursor) if cursor else None
+        if decoded:
+            filters.append(tuple_(Job.created_at, Job.job_id) < decoded)
+            offset = 0
+        else:
+            # Offset mode keeps the page-numbered UI working; the COUNT
+            # is an index-only aggregate
+            count_result = await self.db.execute(
+                select(func.count(Job.id)).where(*filters)
+            )
+            total = count_result.scalar_one()
+            offset = (page - 1) * page_size
+
+        # Fetch one extra row so has_more never needs a second query.
+        # Eager-load output_file in one IN() query and make any other
+        # lazy access raise rather than silently N+1
+        query = (
+            select(Job)
+            .options(selectinload(Job.output_file), raiseload("*"))
+            .where(*filters)
+            .order_by(desc(Job.created_at), desc(Job.job_id))
+            .offset(offset)
+            .limit(page_size + 1)
+        )
+
         result = await self.db.execute(query)
-        jobs = result.scalars().all()
-        
+        jobs = list(result.scalars().all())
+
+        has_more = len(jobs) > page_size
+        jobs = jobs[:page_size]
+
         return JobHistory(
-            jobs=list(jobs),
+            jobs=jobs,
             total=total,
             page=page,
             page_size=page_size,
-            has_more=offset + len(jobs) < total
+            has_more=has_more,
+            next_cursor=_encode_cursor(jobs[-1]) if has_more else None
         )
     
     async def update_job_progress(
@@ -125,15 +205,15 @@ class JobService:
         status: Optional[JobStatus] = None
     ):
         """Update job progress"""
-        result = await self.db.execute(
-            select(Job).where(Job.job_id == job_id)
+        # Progress ticks happen many times per job; a direct UPDATE is
+        # one round trip with no ORM hydration
+        stmt = (
+            update(Job)
+            .where(Job.job_id == job_id)
+            .values(progress=progress, updated_at=func.now())
         )
-        job = result.scalar_one_or_none()
-        
-        if job:
-            job.progress = progress
-            if status:
-                job.status = status
-            job.updated_at = datetime.utcnow()
-            
-            await self.db.commit()
+        if status:
+            stmt = stmt.values(status=status)
+
+        await self.db.execute(stmt)
+        await self.db.commit()
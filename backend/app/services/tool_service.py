@@ -2,11 +2,15 @@
 Tool service - handles file processing operations
 """
 from typing import List, Optional
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import UploadFile
-import uuid
+import aiofiles
+import asyncio
+import hashlib
 from datetime import datetime, timedelta
 from pathlib import Path
+from uuid6 import uuid7
 
 from app.models.models import Job, File, JobStatus, FileType
 from app.core.config import settings
@@ -20,6 +24,30 @@ from app.workers.tasks import (
 
 logger = get_logger(__name__)
 
+# Extensions the processing tools can handle, checked with a single
+# tuple-based endswith before any upload bytes are written to disk
+ALLOWED_EXTENSIONS = (
+    ".pdf", ".doc", ".docx", ".xls", ".xlsx",
+    ".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp", ".tif", ".tiff",
+)
+
+# Exact MIME type -> FileType, one hash lookup per upload instead of a
+# cascade of lowercased substring scans; prefix fallbacks below catch
+# the long tail
+MIME_TO_TYPE = {
+    "application/pdf": FileType.PDF,
+    "application/msword": FileType.WORD,
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": FileType.WORD,
+    "application/vnd.ms-excel": FileType.EXCEL,
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": FileType.EXCEL,
+    "image/png": FileType.IMAGE,
+    "image/jpeg": FileType.IMAGE,
+    "image/webp": FileType.IMAGE,
+    "image/gif": FileType.IMAGE,
+    "image/bmp": FileType.IMAGE,
+    "image/tiff": FileType.IMAGE,
+}
+
 
 class ToolService:
     """Service for file processing tools"""
@@ -44,61 +72,102 @@ class ToolService:
         Returns:
             List of file IDs
         """
-        file_ids = []
-        
+        if len(files) > settings.MAX_FILES_PER_REQUEST:
+            raise ValueError(
+                f"Too many files: maximum {settings.MAX_FILES_PER_REQUEST} per request"
+            )
+
+        # Cheap validation over every file before a single byte is saved,
+        # so a bad batch is rejected without partial writes to clean up
         for upload_file in files:
-            # Validate file size
-            content = await upload_file.read()
-            if len(content) > settings.MAX_UPLOAD_SIZE:
+            if not (upload_file.filename or "").lower().endswith(ALLOWED_EXTENSIONS):
+                raise ValueError(f"File type not supported: {upload_file.filename}")
+
+            if upload_file.size and upload_file.size > settings.MAX_UPLOAD_SIZE:
                 raise ValueError(f"File {upload_file.filename} exceeds maximum size")
-            
-            # Generate unique file ID and path
-            file_id = str(uuid.uuid4())
-            file_ext = Path(upload_file.filename).suffix
-            stored_filename = f"{file_id}{file_ext}"
-            file_path = settings.UPLOAD_DIR / stored_filename
-            
-            # Save file
-            with open(file_path, "wb") as f:
-                f.write(content)
-            
-            # Determine file type
-            file_type = self._determine_file_type(upload_file.content_type)
-            
-            # Create file record
-            file_record = File(
-                file_id=file_id,
-                original_filename=upload_file.filename,
-                stored_filename=stored_filename,
-                file_path=str(file_path),
-                file_size=len(content),
-                file_type=file_type,
-                mime_type=upload_file.content_type or "application/octet-stream",
-                checksum="",  # TODO: Calculate checksum
-                user_id=user_id,
-                guest_token=guest_token,
-                is_input=True,
-                expires_at=datetime.utcnow() + timedelta(hours=settings.FILE_TTL_HOURS)
-            )
-            
-            self.db.add(file_record)
-            file_ids.append(file_id)
-        
+
+        written_paths = []
+        # Bound the fan-out so a 50-file batch doesn't open 50 handles
+        # and thrash the disk with interleaved writes
+        semaphore = asyncio.Semaphore(8)
+
+        async def _save_one(upload_file: UploadFile) -> File:
+            """Stream one upload to disk and build its File record"""
+            async with semaphore:
+                # Generate unique file ID and path
+                file_id = str(uuid7())
+                file_ext = Path(upload_file.filename).suffix
+                stored_filename = f"{file_id}{file_ext}"
+                file_path = settings.UPLOAD_DIR / stored_filename
+
+                # Record the path before the first byte is written so
+                # the gather-failure cleanup also removes partially
+                # written files (client disconnect, disk full)
+                written_paths.append(file_path)
+
+                # Stream from the multipart spool to the final location
+                # in 64 KB chunks instead of buffering the whole upload
+                # in memory; the checksum rides along in the same pass
+                file_size = 0
+                hasher = hashlib.sha256()
+                async with aiofiles.open(file_path, "wb") as f:
+                    while chunk := await upload_file.read(64 * 1024):
+                        file_size += len(chunk)
+                        hasher.update(chunk)
+                        await f.write(chunk)
+
+                if file_size > settings.MAX_UPLOAD_SIZE:
+                    raise ValueError(
+                        f"File {upload_file.filename} exceeds maximum size"
+                    )
+
+                return File(
+                    file_id=file_id,
+                    original_filename=upload_file.filename,
+                    stored_filename=stored_filename,
+                    file_path=str(file_path),
+                    file_size=file_size,
+                    file_type=self._determine_file_type(upload_file.content_type),
+                    mime_type=upload_file.content_type or "application/octet-stream",
+                    checksum=hasher.hexdigest(),
+                    user_id=user_id,
+                    guest_token=guest_token,
+                    is_input=True,
+                    expires_at=datetime.utcnow() + timedelta(hours=settings.FILE_TTL_HOURS)
+                )
+
+        # Save files concurrently; the session is only touched after the
+        # gather since AsyncSession is not safe for concurrent use.
+        # return_exceptions so every sibling finishes before cleanup -
+        # otherwise a straggler could re-write a file after its unlink
+        results = await asyncio.gather(
+            *map(_save_one, files), return_exceptions=True
+        )
+        error = next((r for r in results if isinstance(r, BaseException)), None)
+        if error is not None:
+            for path in written_paths:
+                path.unlink(missing_ok=True)
+            raise error
+
+        # One add_all + flush lets SQLAlchemy's insertmanyvalues batch
+        # the whole upload into a single multi-row INSERT instead of one
+        # statement per file
+        self.db.add_all(results)
         await self.db.commit()
-        return file_ids
+        return [file_record.file_id for file_record in results]
     
-    def _determine_file_type(self, mime_type: str) -> FileType:
+    def _determine_file_type(self, mime_type: Optional[str]) -> FileType:
         """Determine file type from MIME type"""
-        if "pdf" in mime_type.lower():
-            return FileType.PDF
-        elif "word" in mime_type.lower() or "document" in mime_type.lower():
-            return FileType.WORD
-        elif "excel" in mime_type.lower() or "spreadsheet" in mime_type.lower():
-            return FileType.EXCEL
-        elif "image" in mime_type.lower():
-            return FileType.IMAGE
-        else:
+        if not mime_type:
             return FileType.OTHER
+
+        file_type = MIME_TO_TYPE.get(mime_type)
+        if file_type is not None:
+            return file_type
+
+        if mime_type.startswith("image/"):
+            return FileType.IMAGE
+        return FileType.OTHER
     
     async def _create_job(
         self,
@@ -108,22 +177,26 @@ class ToolService:
         user_id: Optional[int] = None
     ) -> Job:
         """Create a new job"""
-        job_id = str(uuid.uuid4())
-        
-        job = Job(
-            job_id=job_id,
-            tool_name=tool_name,
-            status=JobStatus.PENDING,
-            user_id=user_id,
-            guest_token=guest_token,
-            input_files_count=input_files_count,
-            expires_at=datetime.utcnow() + timedelta(hours=settings.FILE_TTL_HOURS)
+        job_id = str(uuid7())
+
+        # RETURNING gives us the server-generated columns in the same
+        # round trip, avoiding the refresh SELECT after commit
+        result = await self.db.execute(
+            insert(Job)
+            .values(
+                job_id=job_id,
+                tool_name=tool_name,
+                status=JobStatus.PENDING,
+                user_id=user_id,
+                guest_token=guest_token,
+                input_files_count=input_files_count,
+                expires_at=datetime.utcnow() + timedelta(hours=settings.FILE_TTL_HOURS)
+            )
+            .returning(Job)
         )
-        
-        self.db.add(job)
+        job = result.scalar_one()
         await self.db.commit()
-        await self.db.refresh(job)
-        
+
         return job
     
     async def merge_pdfs(
@@ -141,8 +214,13 @@ class ToolService:
             user_id
         )
         
-        # Queue background task
-        merge_pdfs_task.delay(job.job_id, file_ids, output_filename)
+        # Queue background task. task_id reuses the job's uuid so the
+        # broker message, worker logs, and any future revoke all key on
+        # the same id without generating a second uuid per dispatch
+        merge_pdfs_task.apply_async(
+            args=(job.job_id, file_ids, output_filename),
+            task_id=job.job_id
+        )
         
         return job
     
@@ -163,7 +241,10 @@ class ToolService:
             user_id
         )
         
-        split_pdf_task.delay(job.job_id, file_id, split_type, pages, ranges)
+        split_pdf_task.apply_async(
+            args=(job.job_id, file_id, split_type, pages, ranges),
+            task_id=job.job_id
+        )
         
         return job
     
@@ -182,7 +263,10 @@ class ToolService:
             user_id
         )
         
-        compress_pdf_task.delay(job.job_id, file_id, compression_level)
+        compress_pdf_task.apply_async(
+            args=(job.job_id, file_id, compression_level),
+            task_id=job.job_id
+        )
         
         return job
     
@@ -200,7 +284,9 @@ class ToolService:
             user_id
         )
         
-        convert_pdf_to_word_task.delay(job.job_id, file_id)
+        convert_pdf_to_word_task.apply_async(
+            args=(job.job_id, file_id), task_id=job.job_id
+        )
         
         return job
     
@@ -218,7 +304,9 @@ class ToolService:
             user_id
         )
         
-        convert_word_to_pdf_task.delay(job.job_id, file_id)
+        convert_word_to_pdf_task.apply_async(
+            args=(job.job_id, file_id), task_id=job.job_id
+        )
         
         return job
     
@@ -237,7 +325,10 @@ class ToolService:
             user_id
         )
         
-        convert_pdf_to_images_task.delay(job.job_id, file_id, output_format)
+        convert_pdf_to_images_task.apply_async(
+            args=(job.job_id, file_id, output_format),
+            task_id=job.job_id
+        )
         
         return job
     
@@ -256,7 +347,10 @@ class ToolService:
             user_id
         )
         
-        convert_images_to_pdf_task.delay(job.job_id, file_ids, output_filename)
+        convert_images_to_pdf_task.apply_async(
+            args=(job.job_id, file_ids, output_filename),
+            task_id=job.job_id
+        )
         
         return job
     
@@ -279,9 +373,12 @@ class ToolService:
             user_id
         )
         
-        convert_image_format_task.delay(
-            job.job_id, file_id, output_format,
-            quality, width, height, maintain_aspect_ratio
+        convert_image_format_task.apply_async(
+            args=(
+                job.job_id, file_id, output_format,
+                quality, width, height, maintain_aspect_ratio
+            ),
+            task_id=job.job_id
         )
         
         return job
@@ -1,8 +1,10 @@
 """
 User service - handles user management
 """
+import asyncio
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, raiseload
 
 from app.models.models import User, Job, File, JobStatus
 from app.schemas.schemas import UserUpdate, UserDashboard, UserResponse
@@ -20,44 +22,35 @@ class UserService:
     
     async def get_user_dashboard(self, user_id: int) -> UserDashboard:
         """Get user dashboard statistics"""
-        # Get user
-        user_result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = user_result.scalar_one()
-        
-        # Get job statistics
-        total_jobs_result = await self.db.execute(
-            select(func.count(Job.id)).where(Job.user_id == user_id)
-        )
-        total_jobs = total_jobs_result.scalar() or 0
+        # Get user - session.get hits the identity map first, so a row
+        # already loaded by the auth dependency costs zero SQL
+        user = await self.db.get_one(User, user_id)
         
-        completed_jobs_result = await self.db.execute(
-            select(func.count(Job.id)).where(
-                Job.user_id == user_id,
-                Job.status == JobStatus.COMPLETED
-            )
+        # Job and storage statistics in one round trip: filtered
+        # aggregates share a single scan of the user's jobs, and the
+        # storage sum rides along as a scalar subquery
+        storage_subquery = (
+            select(func.coalesce(func.sum(File.file_size), 0))
+            .where(File.user_id == user_id)
+            .scalar_subquery()
         )
-        completed_jobs = completed_jobs_result.scalar() or 0
-        
-        failed_jobs_result = await self.db.execute(
-            select(func.count(Job.id)).where(
-                Job.user_id == user_id,
-                Job.status == JobStatus.FAILED
-            )
+        stats_result = await self.db.execute(
+            select(
+                func.count(Job.id),
+                func.count(Job.id).filter(Job.status == JobStatus.COMPLETED),
+                func.count(Job.id).filter(Job.status == JobStatus.FAILED),
+                storage_subquery,
+            ).where(Job.user_id == user_id)
         )
-        failed_jobs = failed_jobs_result.scalar() or 0
-        
-        # Get file statistics
-        files_result = await self.db.execute(
-            select(func.sum(File.file_size)).where(File.user_id == user_id)
-        )
-        total_storage = files_result.scalar() or 0
+        total_jobs, completed_jobs, failed_jobs, total_storage = stats_result.one()
         storage_used_mb = total_storage / (1024 * 1024)
         
-        # Get recent jobs
+        # Get recent jobs - output_file comes along in one IN() query,
+        # and raiseload turns any future lazy access into a loud error
+        # instead of a silent N+1
         recent_jobs_result = await self.db.execute(
             select(Job)
+            .options(selectinload(Job.output_file), raiseload("*"))
             .where(Job.user_id == user_id)
             .order_by(Job.created_at.desc())
             .limit(10)
@@ -65,7 +58,7 @@ class UserService:
         recent_jobs = recent_jobs_result.scalars().all()
         
         return UserDashboard(
-            user=UserResponse.from_orm(user),
+            user=UserResponse.model_validate(user),
             total_jobs=total_jobs,
             completed_jobs=completed_jobs,
             failed_jobs=failed_jobs,
@@ -80,10 +73,7 @@ class UserService:
         user_update: UserUpdate
     ) -> User:
         """Update user profile"""
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one()
+        user = await self.db.get_one(User, user_id)
         
         if user_update.email:
             user.email = user_update.email
@@ -92,7 +82,10 @@ class UserService:
         if user_update.full_name is not None:
             user.full_name = user_update.full_name
         if user_update.password:
-            user.hashed_password = get_password_hash(user_update.password)
+            # bcrypt is CPU-bound; keep it off the event loop
+            user.hashed_password = await asyncio.to_thread(
+                get_password_hash, user_update.password
+            )
         
         await self.db.commit()
         await self.db.refresh(user)
@@ -101,10 +94,7 @@ class UserService:
     
     async def delete_user(self, user_id: int):
         """Delete user and all associated data"""
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one()
+        user = await self.db.get_one(User, user_id)
         
         # Soft delete - just deactivate
         user.is_active = False
@@ -2,12 +2,38 @@
 Celery background tasks for file processing
 """
 from celery import Task
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import List, Optional, Tuple
 from pathlib import Path
-import PyPDF2
-from PIL import Image
+import pikepdf
+from PIL import Image, ImageSequence
 from pdf2image import convert_from_path
+
+# Hard ceiling on decoded pixels: a malicious or runaway image must
+# raise DecompressionBombError instead of OOM-killing the worker (which
+# would just re-OOM on every retry). 200 MP comfortably covers any
+# legitimate scan
+Image.MAX_IMAGE_PIXELS = 200_000_000
+
+# pdfium renders in-process and releases the GIL, skipping poppler's
+# per-batch pdftoppm subprocess spawns; keep poppler as the fallback on
+# hosts where the pypdfium2 wheel is unavailable
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# img2pdf builds image-per-page PDFs by embedding the source bytes
+# directly; optional, with a Pillow fallback for inputs it rejects
+try:
+    import img2pdf
+except ImportError:
+    img2pdf = None
+import os
+import shutil
 import subprocess
+import time
 from datetime import datetime
 
 from app.workers.celery_app import celery_app
@@ -16,17 +42,84 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# JPEG quality per compression level - "low" is the smallest output,
+# mirroring the old gs /screen < /ebook < /printer ladder
+_COMPRESS_JPEG_QUALITY = {"low": 50, "medium": 70, "high": 85}
+
+# Longest image side kept when building PDFs; larger sources get an
+# integer box-filter reduce before their pixel buffer is retained
+_MAX_SOURCE_SIDE = 8000
+
 
 class DatabaseTask(Task):
-    """Base task with database session"""
-    _db = None
-    
-    @property
-    def db(self):
-        if self._db is None:
-            from app.db.session import AsyncSessionLocal
-            self._db = AsyncSessionLocal()
-        return self._db
+    """Base class for DB-touching tasks
+
+    DB access goes through the process-wide synchronous scoped_session
+    in the helpers below (get_file_paths, update_job_status,
+    complete_job); nothing is kept on the task instance.
+    """
+
+
+# Live progress is ephemeral: ticks go to Redis (sub-ms, no WAL/MVCC
+# churn) and the API overlays them onto status reads; only status
+# transitions and terminal results are persisted to Postgres
+_PROGRESS_TTL_SECONDS = 300
+_redis_client = None
+
+
+def _get_redis():
+    global _redis_client
+    if _redis_client is None:
+        import redis as redis_lib
+        _redis_client = redis_lib.Redis.from_url(
+            settings.REDIS_URL, password=settings.REDIS_PASSWORD
+        )
+    return _redis_client
+
+
+def _publish_progress(job_id: str, progress: int) -> bool:
+    """Best-effort Redis progress write; False means use the DB path"""
+    import orjson
+
+    try:
+        _get_redis().set(
+            f"jobprogress:{job_id}",
+            orjson.dumps(progress),
+            ex=_PROGRESS_TTL_SECONDS
+        )
+        return True
+    except Exception:
+        return False
+
+
+class _ProgressReporter:
+    """Coalesce per-item progress writes and keep them off Postgres
+
+    Per-item reporting turns a 100-part job into 100 writes nobody
+    polls fast enough to see, so updates go through when progress
+    advances by `step` points or `interval` seconds elapse, whichever
+    first - and land in Redis, falling back to a DB update only when
+    Redis is unreachable.
+    """
+
+    def __init__(self, job_id: str, step: int = 10, interval: float = 2.0):
+        self.job_id = job_id
+        self.step = step
+        self.interval = interval
+        self._last_progress = 0
+        self._last_ts = time.monotonic()
+
+    def report(self, progress: int, force: bool = False):
+        now = time.monotonic()
+        if (
+            force
+            or progress - self._last_progress >= self.step
+            or now - self._last_ts > self.interval
+        ):
+            if not _publish_progress(self.job_id, progress):
+                update_job_status(self.job_id, "processing", progress)
+            self._last_progress = progress
+            self._last_ts = now
 
 
 @celery_app.task(bind=True, base=DatabaseTask)
@@ -53,30 +146,37 @@ def merge_pdfs_task(
         # Get file paths
         file_paths = get_file_paths(file_ids)
         
-        # Merge PDFs
-        merger = PyPDF2.PdfMerger()
-        
-        for i, file_path in enumerate(file_paths):
-            merger.append(str(file_path))
-            progress = 10 + int((i + 1) / len(file_paths) * 70)
-            update_job_status(job_id, "processing", progress)
-        
-        # Save merged PDF
         output_path = settings.UPLOAD_DIR / output_filename
-        merger.write(str(output_path))
-        merger.close()
-        
-        # Create output file record
-        output_file_id = create_output_file(
-            job_id,
-            output_path,
-            output_filename,
-            "application/pdf"
-        )
-        
-        # Update job as completed
-        update_job_status(job_id, "completed", 100, output_file_id)
+
+        with ExitStack() as stack:
+            # Open source PDFs concurrently - qpdf's parsing runs in
+            # C++ and releases the GIL - then extend the output in the
+            # caller's order. Sources must stay open until save: pages
+            # are held by reference and only copied into the output
+            # during serialization
+            def open_pdf(file_path: Path) -> pikepdf.Pdf:
+                return stack.enter_context(pikepdf.open(str(file_path)))
+
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(file_paths)) or 1
+            ) as executor:
+                sources = list(executor.map(open_pdf, file_paths))
+
+            # pikepdf keeps the merge in qpdf's object model: pages are
+            # appended as references and resolved lazily, so peak RSS
+            # tracks the output being written rather than every parsed
+            # source held as Python objects the way PdfWriter merges do
+            merged = pikepdf.new()
+            reporter = _ProgressReporter(job_id)
+            for i, src in enumerate(sources, start=1):
+                merged.pages.extend(src.pages)
+                reporter.report(10 + int(i / len(sources) * 70))
+
+            merged.save(str(output_path))
         
+        # Record output file and completion in one transaction
+        complete_job(job_id, output_path, output_filename, "application/pdf")
+
         logger.info("PDF merge completed", job_id=job_id)
         
     except Exception as e:
@@ -109,31 +209,54 @@ def split_pdf_task(
         update_job_status(job_id, "processing", 10)
         
         # Get file path
-        file_path = get_file_paths([file_id])[0]
-        
-        # Read PDF
-        reader = PyPDF2.PdfReader(str(file_path))
-        total_pages = len(reader.pages)
-        
-        if split_type == "pages" and pages:
-            # Extract specific pages
-            writer = PyPDF2.PdfWriter()
-            for page_num in pages:
-                if 0 <= page_num < total_pages:
-                    writer.add_page(reader.pages[page_num])
-            
-            output_path = settings.UPLOAD_DIR / f"split_{file_id}.pdf"
-            with open(output_path, "wb") as output_file:
-                writer.write(output_file)
-            
-            output_file_id = create_output_file(
-                job_id,
-                output_path,
-                output_path.name,
-                "application/pdf"
-            )
-        
-        update_job_status(job_id, "completed", 100, output_file_id)
+        file_path = get_file_path(file_id)
+
+        # pikepdf (qpdf) copies appended pages by object reference and
+        # only serializes them at save time, so peak RSS tracks the
+        # output being written rather than a full in-memory rebuild of
+        # the source the way PdfWriter does
+        with pikepdf.open(str(file_path)) as src:
+            total_pages = len(src.pages)
+
+            if split_type == "pages" and pages:
+                # Extract specific pages into a single PDF
+                dst = pikepdf.new()
+                for page_num in pages:
+                    if 0 <= page_num < total_pages:
+                        dst.pages.append(src.pages[page_num])
+
+                output_path = settings.UPLOAD_DIR / f"split_{file_id}.pdf"
+                dst.save(str(output_path))
+
+                complete_job(job_id, output_path, output_path.name, "application/pdf")
+            elif split_type == "ranges" and ranges:
+                # One PDF per (start, end) range, zipped together. Ranges are
+                # 0-based and end-exclusive, matching Python slicing.
+                import io
+                import zipfile
+
+                output_path = settings.UPLOAD_DIR / f"split_{file_id}.zip"
+                # ZIP_STORED (explicit): PDF content streams are already
+                # flate-compressed, so deflating the archive again would
+                # spend zlib CPU for near-zero size reduction
+                reporter = _ProgressReporter(job_id)
+                with zipfile.ZipFile(
+                    output_path, "w", compression=zipfile.ZIP_STORED
+                ) as zipf:
+                    for i, (start, end) in enumerate(ranges, start=1):
+                        dst = pikepdf.new()
+                        for page in src.pages[max(start, 0):min(end, total_pages)]:
+                            dst.pages.append(page)
+
+                        part = io.BytesIO()
+                        dst.save(part)
+                        zipf.writestr(f"pages_{start + 1}-{end}.pdf", part.getvalue())
+                        reporter.report(10 + int(i / len(ranges) * 80))
+
+                complete_job(job_id, output_path, output_path.name, "application/zip")
+            else:
+                raise ValueError(f"Invalid split request: {split_type}")
+
         logger.info("PDF split completed", job_id=job_id)
         
     except Exception as e:
@@ -161,38 +284,56 @@ def compress_pdf_task(
         
         update_job_status(job_id, "processing", 10)
         
-        file_path = get_file_paths([file_id])[0]
+        import io
+
+        file_path = get_file_path(file_id)
         output_path = settings.UPLOAD_DIR / f"compressed_{file_id}.pdf"
+
+        # In-process compression via pikepdf (qpdf backend): no gs fork
+        # per job, text streams are repacked rather than re-rasterized,
+        # and embedded images are recompressed as JPEG at a quality
+        # matching the requested level
+        jpeg_quality = _COMPRESS_JPEG_QUALITY.get(compression_level, 70)
+
+        with pikepdf.open(str(file_path)) as pdf:
+            for page in pdf.pages:
+                for raw_image in page.images.values():
+                    try:
+                        pil_image = pikepdf.PdfImage(raw_image).as_pil_image()
+                    except Exception:
+                        # Leave exotic encodings (JBIG2, masks...) as-is
+                        continue
+                    if pil_image.mode not in ("RGB", "L"):
+                        pil_image = pil_image.convert("RGB")
+                    buffer = io.BytesIO()
+                    pil_image.save(
+                        buffer, "JPEG", quality=jpeg_quality, optimize=True
+                    )
+                    raw_image.write(
+                        buffer.getvalue(), filter=pikepdf.Name("/DCTDecode")
+                    )
+                    # write() only swaps the data and /Filter; the
+                    # dictionary must be rewritten to describe the JPEG
+                    # actually stored, or indexed-palette, 1-bit and
+                    # CMYK sources render corrupted (wrong component
+                    # count / bit depth, stale /Decode ramp)
+                    raw_image.ColorSpace = (
+                        pikepdf.Name("/DeviceRGB")
+                        if pil_image.mode == "RGB"
+                        else pikepdf.Name("/DeviceGray")
+                    )
+                    raw_image.BitsPerComponent = 8
+                    if "/Decode" in raw_image:
+                        del raw_image.Decode
+
+            pdf.save(
+                str(output_path),
+                compress_streams=True,
+                object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                recompress_flate=True,
+            )
         
-        # Use Ghostscript for compression
-        quality_settings = {
-            "low": "/screen",
-            "medium": "/ebook",
-            "high": "/printer"
-        }
-        
-        gs_quality = quality_settings.get(compression_level, "/ebook")
-        
-        subprocess.run([
-            "gs",
-            "-sDEVICE=pdfwrite",
-            "-dCompatibilityLevel=1.4",
-            f"-dPDFSETTINGS={gs_quality}",
-            "-dNOPAUSE",
-            "-dQUIET",
-            "-dBATCH",
-            f"-sOutputFile={output_path}",
-            str(file_path)
-        ], check=True)
-        
-        output_file_id = create_output_file(
-            job_id,
-            output_path,
-            output_path.name,
-            "application/pdf"
-        )
-        
-        update_job_status(job_id, "completed", 100, output_file_id)
+        complete_job(job_id, output_path, output_path.name, "application/pdf")
         logger.info("PDF compression completed", job_id=job_id)
         
     except Exception as e:
@@ -200,35 +341,71 @@ def compress_pdf_task(
         update_job_status(job_id, "failed", 0, error_message=str(e))
 
 
+def _convert_with_libreoffice(file_path: Path, target_format: str) -> Path:
+    """Run a headless LibreOffice conversion with a persistent profile.
+
+    A large share of soffice's 2-3s cold start is first-run user-profile
+    initialization; pointing every invocation in this worker process at
+    the same profile dir pays that cost once per worker instead of once
+    per conversion.
+
+    Output lands in TEMP_DIR (tmpfs in the compose stack), so soffice's
+    many small writes and fsyncs hit RAM; only the finished file is
+    moved onto the persistent upload volume.
+    """
+    profile_dir = settings.TEMP_DIR / f"lo_profile_{os.getpid()}"
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    out_dir = settings.TEMP_DIR / f"lo_out_{os.getpid()}"
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    subprocess.run([
+        "libreoffice",
+        "--headless",
+        # Skip startup work that a batch conversion never needs:
+        # session restore, the lockfile dance (each invocation owns its
+        # profile dir), the default blank document, and branding
+        "--norestore",
+        "--nolockcheck",
+        "--nodefault",
+        "--nologo",
+        # as_uri() yields a proper absolute file:/// URL; naive
+        # "file://" + path breaks when TEMP_DIR is relative (the first
+        # path segment gets parsed as a URL authority)
+        f"-env:UserInstallation={profile_dir.resolve().as_uri()}",
+        "--convert-to",
+        target_format,
+        "--outdir",
+        str(out_dir),
+        str(file_path)
+    ], check=True)
+
+    # soffice names the output after the input stem. shutil.move rather
+    # than os.replace: tmpfs and the upload volume are different
+    # filesystems, so a rename would fail with EXDEV
+    scratch_path = out_dir / f"{file_path.stem}.{target_format}"
+    final_path = settings.UPLOAD_DIR / scratch_path.name
+    shutil.move(str(scratch_path), str(final_path))
+    return final_path
+
+
 @celery_app.task(bind=True, base=DatabaseTask)
 def convert_pdf_to_word_task(self, job_id: str, file_id: str):
     """Convert PDF to Word document"""
     try:
         logger.info("Starting PDF to Word conversion", job_id=job_id)
         update_job_status(job_id, "processing", 10)
-        
-        file_path = get_file_paths([file_id])[0]
+
+        file_path = get_file_path(file_id)
         output_path = settings.UPLOAD_DIR / f"{file_id}.docx"
+
+        _convert_with_libreoffice(file_path, "docx")
         
-        # Use LibreOffice for conversion
-        subprocess.run([
-            "libreoffice",
-            "--headless",
-            "--convert-to",
-            "docx",
-            "--outdir",
-            str(settings.UPLOAD_DIR),
-            str(file_path)
-        ], check=True)
-        
-        output_file_id = create_output_file(
+        complete_job(
             job_id,
             output_path,
             output_path.name,
             "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
         )
-        
-        update_job_status(job_id, "completed", 100, output_file_id)
         logger.info("PDF to Word conversion completed", job_id=job_id)
         
     except Exception as e:
@@ -243,28 +420,12 @@ def convert_word_to_pdf_task(self, job_id: str, file_id: str):
         logger.info("Starting Word to PDF conversion", job_id=job_id)
         update_job_status(job_id, "processing", 10)
         
-        file_path = get_file_paths([file_id])[0]
+        file_path = get_file_path(file_id)
         output_path = settings.UPLOAD_DIR / f"{file_id}.pdf"
+
+        _convert_with_libreoffice(file_path, "pdf")
         
-        # Use LibreOffice for conversion
-        subprocess.run([
-            "libreoffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(settings.UPLOAD_DIR),
-            str(file_path)
-        ], check=True)
-        
-        output_file_id = create_output_file(
-            job_id,
-            output_path,
-            output_path.name,
-            "application/pdf"
-        )
-        
-        update_job_status(job_id, "completed", 100, output_file_id)
+        complete_job(job_id, output_path, output_path.name, "application/pdf")
         logger.info("Word to PDF conversion completed", job_id=job_id)
         
     except Exception as e:
@@ -272,6 +433,38 @@ def convert_word_to_pdf_task(self, job_id: str, file_id: str):
         update_job_status(job_id, "failed", 0, error_message=str(e))
 
 
+def _render_pdf_pages(file_path: Path):
+    """Rasterize PDF pages to PIL images, one page at a time
+
+    Prefers pdfium, which renders lazily: only the page currently being
+    encoded holds a pixel buffer, instead of poppler's
+    all-pages-up-front list. Resolution comes from PDF_RENDER_DPI; the
+    bitmaps are opaque RGB (no alpha plane to carry around)
+    """
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(str(file_path))
+        try:
+            for index in range(len(pdf)):
+                page = pdf[index]
+                bitmap = page.render(scale=settings.PDF_RENDER_DPI / 72)
+                try:
+                    yield bitmap.to_pil()
+                finally:
+                    bitmap.close()
+                    page.close()
+        finally:
+            pdf.close()
+    else:
+        # thread_count splits the page range across parallel pdftoppm
+        # processes; capped so concurrent jobs on one worker box don't
+        # oversubscribe
+        yield from convert_from_path(
+            str(file_path),
+            dpi=settings.PDF_RENDER_DPI,
+            thread_count=min(4, os.cpu_count() or 1)
+        )
+
+
 @celery_app.task(bind=True, base=DatabaseTask)
 def convert_pdf_to_images_task(
     self,
@@ -284,30 +477,51 @@ def convert_pdf_to_images_task(
         logger.info("Starting PDF to images conversion", job_id=job_id)
         update_job_status(job_id, "processing", 10)
         
-        file_path = get_file_paths([file_id])[0]
-        
-        # Convert PDF to images
-        images = convert_from_path(str(file_path))
-        
+        file_path = get_file_path(file_id)
+
         # Save images as ZIP
+        import io
         import zipfile
+        from collections import deque
         output_path = settings.UPLOAD_DIR / f"{file_id}_images.zip"
+
+        def encode(image: Image.Image) -> io.BytesIO:
+            buffer = io.BytesIO()
+            image.save(buffer, output_format.upper())
+            # Release the page's pixel buffer as soon as it's encoded
+            image.close()
+            return buffer
+
+        # Rendering stays serial (pdfium is not thread-safe, and
+        # daemonic prefork children can't spawn a process pool), but
+        # JPEG/PNG encoding - the dominant per-page cost - releases the
+        # GIL in Pillow, so a bounded pipeline encodes pages
+        # concurrently while the next page renders. The window cap
+        # keeps at most a few decoded pages resident; archive entries
+        # are still written in page order. ZIP_STORED because the
+        # encoded payloads are already entropy-coded - deflating them
+        # again burns CPU for ~0% size win
+        max_inflight = min(4, os.cpu_count() or 1)
+        window = deque()
+        with zipfile.ZipFile(
+            output_path, "w", compression=zipfile.ZIP_STORED
+        ) as zipf, ThreadPoolExecutor(max_workers=max_inflight) as executor:
+            for i, image in enumerate(_render_pdf_pages(file_path), start=1):
+                window.append((i, executor.submit(encode, image)))
+                if len(window) > max_inflight:
+                    page_num, future = window.popleft()
+                    zipf.writestr(
+                        f"page_{page_num}.{output_format}",
+                        future.result().getbuffer()
+                    )
+            while window:
+                page_num, future = window.popleft()
+                zipf.writestr(
+                    f"page_{page_num}.{output_format}",
+                    future.result().getbuffer()
+                )
         
-        with zipfile.ZipFile(output_path, 'w') as zipf:
-            for i, image in enumerate(images):
-                img_path = settings.TEMP_DIR / f"page_{i+1}.{output_format}"
-                image.save(str(img_path), output_format.upper())
-                zipf.write(img_path, f"page_{i+1}.{output_format}")
-                img_path.unlink()
-        
-        output_file_id = create_output_file(
-            job_id,
-            output_path,
-            output_path.name,
-            "application/zip"
-        )
-        
-        update_job_status(job_id, "completed", 100, output_file_id)
+        complete_job(job_id, output_path, output_path.name, "application/zip")
         logger.info("PDF to images conversion completed", job_id=job_id)
         
     except Exception as e:
@@ -324,96 +538,75 @@ def convert_images_to_pdf_task(
 ):
     """Convert images to PDF"""
     try:
-        logger.info("Starting images to PDF conversion", extra={
-            "job_id": job_id,
-            "file_count": len(file_ids),
-            "output_filename": output_filename
-        })
+        logger.info(
+            "Starting images to PDF conversion",
+            job_id=job_id,
+            file_count=len(file_ids)
+        )
         update_job_status(job_id, "processing", 10)
-        logger.info(f"Job {job_id} status updated to processing")
-        
-        logger.info(f"Retrieving file paths for {len(file_ids)} files", extra={"job_id": job_id})
+
         file_paths = get_file_paths(file_ids)
-        logger.info(f"Retrieved {len(file_paths)} file paths", extra={
-            "job_id": job_id,
-            "paths": [str(p) for p in file_paths]
-        })
-        
-        # Open images
-        logger.info(f"Opening {len(file_paths)} images", extra={"job_id": job_id})
-        images = []
-        for idx, path in enumerate(file_paths):
-            logger.debug(f"Opening image {idx + 1}/{len(file_paths)}: {path}", extra={"job_id": job_id})
+        output_path = settings.UPLOAD_DIR / output_filename
+
+        # Fast path: img2pdf embeds the original JPEG/PNG bytes into
+        # the PDF untouched - no decode, no RGB conversion, no
+        # re-encode - so memory tracks file sizes, not pixel buffers.
+        # It rejects inputs it can't embed losslessly (alpha channels,
+        # exotic modes), in which case we fall back to the Pillow path
+        saved = False
+        if img2pdf is not None:
             try:
-                img = Image.open(str(path))
-                logger.debug(f"Image {idx + 1} opened successfully - mode: {img.mode}, size: {img.size}", extra={"job_id": job_id})
-                images.append(img)
+                with open(output_path, "wb") as out:
+                    out.write(img2pdf.convert([str(p) for p in file_paths]))
+                saved = True
             except Exception as e:
-                logger.error(f"Failed to open image {idx + 1} ({path}): {str(e)}", extra={"job_id": job_id})
-                raise
-        
-        logger.info(f"Successfully opened {len(images)} images", extra={"job_id": job_id})
-        update_job_status(job_id, "processing", 30)
-        
-        # Convert to RGB if necessary
-        logger.info("Converting images to RGB mode", extra={"job_id": job_id})
-        images_rgb = []
-        for idx, img in enumerate(images):
-            logger.debug(f"Converting image {idx + 1}/{len(images)} - original mode: {img.mode}", extra={"job_id": job_id})
-            if img.mode != 'RGB':
-                logger.debug(f"Image {idx + 1} requires conversion from {img.mode} to RGB", extra={"job_id": job_id})
-                img = img.convert('RGB')
-                logger.debug(f"Image {idx + 1} converted to RGB successfully", extra={"job_id": job_id})
-            images_rgb.append(img)
-        
-        logger.info(f"All {len(images_rgb)} images converted to RGB", extra={"job_id": job_id})
+                logger.info(
+                    "img2pdf fast path refused inputs, using Pillow",
+                    job_id=job_id,
+                    reason=str(e)
+                )
+
         update_job_status(job_id, "processing", 60)
-        
-        # Save as PDF
-        output_path = settings.UPLOAD_DIR / output_filename
-        logger.info(f"Saving PDF to {output_path}", extra={"job_id": job_id})
-        try:
+
+        if not saved:
+            # Open and RGB-convert in one pass: the old separate loops
+            # kept every image resident twice (original + converted)
+            # and walked the list a second time just to change modes.
+            # Multi-frame inputs (animated GIF, multi-page TIFF) expand
+            # to one PDF page per frame instead of silently dropping
+            # all but the first
+            def load_rgb(path: Path) -> List[Image.Image]:
+                img = Image.open(str(path))
+                frames = []
+                for frame in ImageSequence.Iterator(img):
+                    if max(frame.size) > _MAX_SOURCE_SIDE:
+                        # Integer reduce is a cheap box filter and
+                        # shrinks the buffer before it's retained
+                        frame = frame.reduce(
+                            -(-max(frame.size) // _MAX_SOURCE_SIDE)
+                        )
+                    # convert() copies; copy() detaches an already-RGB
+                    # frame from the shared per-frame decode buffer
+                    frames.append(
+                        frame.convert("RGB") if frame.mode != "RGB" else frame.copy()
+                    )
+                return frames
+
+            images_rgb = [
+                frame for path in file_paths for frame in load_rgb(path)
+            ]
             images_rgb[0].save(
                 str(output_path),
                 save_all=True,
                 append_images=images_rgb[1:] if len(images_rgb) > 1 else [],
                 format="PDF"
             )
-            logger.info(f"PDF saved successfully to {output_path}", extra={
-                "job_id": job_id,
-                "file_size": output_path.stat().st_size if output_path.exists() else 0
-            })
-        except Exception as e:
-            logger.error(f"Failed to save PDF: {str(e)}", extra={"job_id": job_id})
-            raise
-        
-        update_job_status(job_id, "processing", 80)
-        
-        logger.info(f"Creating output file record for job {job_id}", extra={"job_id": job_id})
-        output_file_id = create_output_file(
-            job_id,
-            output_path,
-            output_filename,
-            "application/pdf"
-        )
-        logger.info(f"Output file record created with ID: {output_file_id}", extra={
-            "job_id": job_id,
-            "output_file_id": output_file_id
-        })
-        
-        update_job_status(job_id, "completed", 100, output_file_id)
-        logger.info("Images to PDF conversion completed successfully", extra={
-            "job_id": job_id,
-            "output_file_id": output_file_id,
-            "output_filename": output_filename
-        })
-        
+
+        complete_job(job_id, output_path, output_filename, "application/pdf")
+        logger.info("Images to PDF conversion completed", job_id=job_id)
+
     except Exception as e:
-        logger.error("Images to PDF conversion failed", extra={
-            "job_id": job_id,
-            "error": str(e),
-            "error_type": type(e).__name__
-        }, exc_info=True)
+        logger.error("Images to PDF conversion failed", job_id=job_id, error=str(e))
         update_job_status(job_id, "failed", 0, error_message=str(e))
 
 
@@ -433,30 +626,68 @@ def convert_image_format_task(
         logger.info("Starting image conversion", job_id=job_id)
         update_job_status(job_id, "processing", 10)
         
-        file_path = get_file_paths([file_id])[0]
-        
+        file_path = get_file_path(file_id)
+
+        # Same format and no resize is a pure copy: skip the decode +
+        # re-encode round trip entirely and reuse the source bytes.
+        # os.link shares blocks when both paths are on one filesystem;
+        # copyfile (copy_file_range on Linux) covers the rest
+        source_format = file_path.suffix.lstrip(".").lower()
+        requested_format = output_format.lower()
+        same_format = (
+            requested_format == source_format
+            or {requested_format, source_format} == {"jpg", "jpeg"}
+        )
+        if same_format and not (width or height):
+            output_path = settings.UPLOAD_DIR / f"{file_id}.{output_format}"
+            if output_path != file_path:
+                # Drop any previous output first: on an acks_late
+                # redelivery the path already exists (hardlinked to the
+                # source), so link would raise FileExistsError and the
+                # copy fallback SameFileError
+                output_path.unlink(missing_ok=True)
+                try:
+                    os.link(file_path, output_path)
+                except OSError:
+                    shutil.copyfile(file_path, output_path)
+            complete_job(job_id, output_path, output_path.name, f"image/{output_format}")
+            logger.info("Image conversion completed", job_id=job_id)
+            return
+
         # Open image
         image = Image.open(str(file_path))
-        
-        # Resize if dimensions provided
+
+        # For JPEG downscales, let libjpeg decode at 1/2, 1/4 or 1/8
+        # scale inside the IDCT - the decoder then never materializes
+        # the pixels that resize would immediately throw away. thumbnail
+        # still refines from the draft size to the exact target
+        if (width or height) and image.format == "JPEG":
+            image.draft("RGB", (width or image.width, height or image.height))
+
+        # Resize if dimensions provided. reducing_gap pre-shrinks with
+        # a cheap box filter and only runs the expensive Lanczos pass
+        # near the target size - most of the pixels never see the
+        # convolution - while Lanczos keeps downscaled output sharper
+        # than the default bicubic
         if width or height:
             if maintain_aspect_ratio:
-                image.thumbnail((width or image.width, height or image.height))
+                image.thumbnail(
+                    (width or image.width, height or image.height),
+                    Image.Resampling.LANCZOS,
+                    reducing_gap=3.0
+                )
             else:
-                image = image.resize((width or image.width, height or image.height))
+                image = image.resize(
+                    (width or image.width, height or image.height),
+                    Image.Resampling.LANCZOS,
+                    reducing_gap=3.0
+                )
         
         # Save in new format
         output_path = settings.UPLOAD_DIR / f"{file_id}.{output_format}"
         image.save(str(output_path), output_format.upper(), quality=quality)
         
-        output_file_id = create_output_file(
-            job_id,
-            output_path,
-            output_path.name,
-            f"image/{output_format}"
-        )
-        
-        update_job_status(job_id, "completed", 100, output_file_id)
+        complete_job(job_id, output_path, output_path.name, f"image/{output_format}")
         logger.info("Image conversion completed", job_id=job_id)
         
     except Exception as e:
@@ -468,54 +699,176 @@ def convert_image_format_task(
 def cleanup_expired_files():
     """Cleanup expired files (periodic task)"""
     try:
-        from app.db.session import AsyncSessionLocal
-        from app.models.models import File, Job
-        from sqlalchemy import select
-        import asyncio
-        
-        async def cleanup():
-            async with AsyncSessionLocal() as db:
-                # Get expired files
-                result = await db.execute(
-                    select(File).where(
-                        File.expires_at < datetime.utcnow(),
-                        File.is_deleted == False
-                    )
+        from sqlalchemy import update
+        from app.db.session import get_scoped_session
+        from app.models.models import File
+
+        db = get_scoped_session()
+        try:
+            # Single round trip: flip the expired rows and get their
+            # paths back via RETURNING, replacing the old SELECT+UPDATE
+            result = db.execute(
+                update(File)
+                .where(
+                    File.expires_at < datetime.utcnow(),
+                    File.is_deleted == False
                 )
-                expired_files = result.scalars().all()
-                
-                for file in expired_files:
-                    # Delete physical file
-                    file_path = Path(file.file_path)
-                    if file_path.exists():
-                        file_path.unlink()
-                    
-                    # Mark as deleted
-                    file.is_deleted = True
-                
-                await db.commit()
-                
-                logger.info("Cleaned up expired files", count=len(expired_files))
-        
-        asyncio.run(cleanup())
-        
+                .values(is_deleted=True)
+                .returning(File.file_path)
+            )
+            paths = [row[0] for row in result]
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        if paths:
+            # Unlinks overlap in a thread pool - each one is a syscall
+            # wait, which is where all the time goes on slow volumes
+            with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+                list(executor.map(
+                    lambda p: Path(p).unlink(missing_ok=True), paths
+                ))
+
+        logger.info("Cleaned up expired files", count=len(paths))
+
+        _reap_stale_scratch_files()
+
     except Exception as e:
         logger.error("Cleanup task failed", error=str(e))
 
 
+def _reap_stale_scratch_files():
+    """Remove scratch files/dirs in TEMP_DIR older than the file TTL.
+
+    Scratch entries are not tracked in the database, so a crashed task
+    would otherwise leak them forever and disk usage grows unbounded.
+    """
+    cutoff = datetime.utcnow().timestamp() - settings.FILE_TTL_HOURS * 3600
+    reaped = 0
+
+    for entry in settings.TEMP_DIR.glob("*"):
+        try:
+            if entry.stat().st_mtime >= cutoff:
+                continue
+            if _is_live_worker_scratch(entry.name):
+                continue
+            if entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+            else:
+                entry.unlink(missing_ok=True)
+            reaped += 1
+        except OSError:
+            continue
+
+    if reaped:
+        logger.info("Reaped stale scratch entries", count=reaped)
+
+
+def _is_live_worker_scratch(name: str) -> bool:
+    """Whether a scratch entry belongs to a currently running worker.
+
+    The per-process LibreOffice dirs (lo_profile_<pid>, lo_out_<pid>)
+    can legitimately outlive the TTL on a long-lived worker - the
+    profile by design, the out dir briefly during a conversion - so the
+    reaper must not rmtree them while their owner is alive.
+    """
+    for prefix in ("lo_profile_", "lo_out_"):
+        if name.startswith(prefix):
+            try:
+                pid = int(name[len(prefix):])
+            except ValueError:
+                return False
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return False
+            except PermissionError:
+                # A process exists but isn't ours; treat it as live
+                return True
+            return True
+    return False
+
+
 # Helper functions
+def _hash_file(file_path: Path) -> Tuple[str, int]:
+    """Stream a file through SHA-256 with a reused 1 MiB buffer.
+
+    hashlib dispatches to OpenSSL's hardware-accelerated SHA-256, so
+    hashing runs far faster than the disk read; readinto avoids
+    allocating a fresh bytes object per chunk. Returns (hex digest,
+    byte count) so callers get the size from the same read pass
+    instead of a separate stat() - a metadata round trip on networked
+    volumes.
+    """
+    import hashlib
+
+    hasher = hashlib.sha256()
+    size = 0
+    buffer = bytearray(1 << 20)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        while n := f.readinto(buffer):
+            hasher.update(view[:n])
+            size += n
+    return hasher.hexdigest(), size
+
+
+# Keep IN() lists well under driver/DB parameter limits on huge jobs
+_FILE_ID_CHUNK = 500
+
+
 def get_file_paths(file_ids: List[str]) -> List[Path]:
-    """Get file paths from file IDs"""
-    from app.db.session import get_session_local
+    """Get file paths from file IDs, in the order the IDs were given
+
+    IN() returns rows in index order, not argument order, so the old
+    full-entity query silently shuffled pages for merge and
+    images-to-PDF jobs. Rows are fetched as bare columns (no ORM
+    hydration) and reordered through a dict to match the request.
+    """
+    from app.db.session import get_scoped_session
     from app.models.models import File
-    
-    SessionLocal = get_session_local()
-    db = SessionLocal()
+
+    db = get_scoped_session()
+    try:
+        path_by_id = {}
+        for start in range(0, len(file_ids), _FILE_ID_CHUNK):
+            chunk = file_ids[start:start + _FILE_ID_CHUNK]
+            rows = (
+                db.query(File.file_id, File.file_path)
+                .filter(File.file_id.in_(chunk))
+                .all()
+            )
+            path_by_id.update(rows)
+        return [Path(path_by_id[fid]) for fid in file_ids if fid in path_by_id]
+    finally:
+        # End the read transaction but keep the session (and its pooled
+        # connection) for the next helper call in this task
+        db.rollback()
+
+
+def get_file_path(file_id: str) -> Path:
+    """Get a single file's path
+
+    The single-file tasks all called get_file_paths([file_id])[0],
+    paying the chunk/reorder machinery (and an opaque IndexError on a
+    missing row) for a one-row lookup.
+    """
+    from app.db.session import get_scoped_session
+    from app.models.models import File
+
+    db = get_scoped_session()
     try:
-        files = db.query(File).filter(File.file_id.in_(file_ids)).all()
-        return [Path(f.file_path) for f in files]
+        file_path = (
+            db.query(File.file_path)
+            .filter(File.file_id == file_id)
+            .scalar()
+        )
+        if file_path is None:
+            raise ValueError(f"File {file_id} not found")
+        return Path(file_path)
     finally:
-        db.close()
+        db.rollback()
 
 
 def update_job_status(
@@ -525,84 +878,111 @@ def update_job_status(
     output_file_id: Optional[str] = None,
     error_message: Optional[str] = None
 ):
-    """Update job status in database"""
-    from app.db.session import get_session_local
+    """Update job status in database
+
+    Issues one UPDATE with the timing math pushed into SQL, instead of
+    the old SELECT + ORM diff + UPDATE cycle - progress ticks are the
+    hottest DB call the workers make.
+    """
+    from sqlalchemy import func, update
+    from app.db.session import get_scoped_session
     from app.models.models import Job, JobStatus
-    
-    db = None
+
+    values = {
+        "status": JobStatus(status),
+        "progress": progress,
+        "updated_at": func.now(),
+    }
+    if output_file_id:
+        values["output_file_id"] = int(output_file_id) if isinstance(output_file_id, str) and output_file_id.isdigit() else output_file_id
+    if error_message:
+        values["error_message"] = error_message
+    if status == "processing":
+        # First transition wins; later progress ticks keep the original
+        values["processing_started_at"] = func.coalesce(
+            Job.processing_started_at, func.now()
+        )
+    if status == "completed":
+        values["processing_completed_at"] = func.now()
+        # NULL start leaves the duration NULL, matching the old check
+        values["processing_time_seconds"] = func.extract(
+            "epoch", func.now() - Job.processing_started_at
+        )
+
+    db = get_scoped_session()
     try:
-        SessionLocal = get_session_local()
-        db = SessionLocal()
-        
-        job = db.query(Job).filter(Job.job_id == job_id).first()
-        
-        if job:
-            job.status = JobStatus(status)
-            job.progress = progress
-            if output_file_id:
-                job.output_file_id = int(output_file_id) if isinstance(output_file_id, str) and output_file_id.isdigit() else output_file_id
-            if error_message:
-                job.error_message = error_message
-            job.updated_at = datetime.utcnow()
-            
-            if status == "completed":
-                job.processing_completed_at = datetime.utcnow()
-                if job.processing_started_at:
-                    delta = job.processing_completed_at - job.processing_started_at
-                    job.processing_time_seconds = delta.total_seconds()
-            
-            db.commit()
+        result = db.execute(
+            update(Job).where(Job.job_id == job_id).values(**values)
+        )
+        db.commit()
+        if result.rowcount:
             logger.info(f"Updated job {job_id} status to {status}")
         else:
             logger.warning(f"Job {job_id} not found")
     except Exception as e:
+        # Roll back so the shared session is usable for later calls
+        db.rollback()
         logger.error(f"Error updating job status: {str(e)}")
-    finally:
-        if db:
-            db.close()
 
 
-def create_output_file(
+def complete_job(
     job_id: str,
     file_path: Path,
     filename: str,
     mime_type: str
-) -> str:
-    """Create output file record"""
-    from app.db.session import get_session_local
-    from app.models.models import File, Job, FileType
-    import uuid
+):
+    """Record the output file and mark the job completed in one commit.
+
+    The old create_output_file + update_job_status pair ran two
+    sessions, four round trips and two commits back to back, with a
+    window where a poller saw "completed" before the file row existed.
+    """
+    from app.db.session import get_scoped_session
+    from app.models.models import File, Job, JobStatus, FileType
+    from uuid6 import uuid7
     from datetime import timedelta
-    
-    SessionLocal = get_session_local()
-    db = SessionLocal()
+
+    db = get_scoped_session()
     try:
         job = db.query(Job).filter(Job.job_id == job_id).first()
-        
+
         if not job:
             raise ValueError(f"Job {job_id} not found")
-        
-        file_id = str(uuid.uuid4())
+
+        checksum, file_size = _hash_file(file_path)
         file = File(
-            file_id=file_id,
+            file_id=str(uuid7()),
             original_filename=filename,
             stored_filename=file_path.name,
             file_path=str(file_path),
-            file_size=file_path.stat().st_size,
+            file_size=file_size,
             file_type=FileType.PDF if "pdf" in mime_type else FileType.OTHER,
             mime_type=mime_type,
-            checksum="",
+            checksum=checksum,
             user_id=job.user_id,
             guest_token=job.guest_token,
             is_input=False,
             expires_at=datetime.utcnow() + timedelta(hours=settings.FILE_TTL_HOURS)
         )
-        
+
         db.add(file)
+        # flush assigns file.id inside the open transaction
+        db.flush()
+
+        job.output_file_id = file.id
+        job.status = JobStatus.COMPLETED
+        job.progress = 100
+        job.updated_at = datetime.utcnow()
+        job.processing_completed_at = datetime.utcnow()
+        if job.processing_started_at:
+            delta = job.processing_completed_at - job.processing_started_at
+            job.processing_time_seconds = delta.total_seconds()
+
         db.commit()
-        db.refresh(file)
-        
-        logger.info(f"Created output file {file.id} for job {job_id}")
-        return str(file.id)
-    finally:
-        db.close()
+
+        logger.info(f"Job {job_id} completed with output file {file.id}")
+    except Exception:
+        # Leave the shared session clean for the failure-path status
+        # update that follows in the task's except block
+        db.rollback()
+        raise
@@ -0,0 +1,26 @@
+"""
+Gunicorn configuration for the production API server
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Async uvicorn workers so I/O-bound phases (upload recv, disk writes,
+# response send) overlap across concurrent requests. uvicorn[standard]
+# ships uvloop and the worker's "auto" loop selects it, pairing with
+# asyncpg for a C path from event loop to socket; the dev entrypoints
+# pass --loop uvloop explicitly so a broken uvloop install fails loudly
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.environ.get("WORKERS", 2 * multiprocessing.cpu_count() + 1))
+
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers periodically to bound memory growth from PDF processing
+max_requests = 1000
+max_requests_jitter = 100
+
+accesslog = "-"
+errorlog = "-"